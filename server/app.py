@@ -1,6 +1,7 @@
 from flask import Flask
 from flask_migrate import Migrate
 from server.config import Config
+from server.json_provider import OrjsonProvider
 from server.models.restaurant import db
 from server.controllers.restaurant_controller import restaurant_bp
 from server.controllers.pizza_controller import pizza_bp
@@ -8,6 +9,8 @@ from server.controllers.restaurant_pizza_controller import restaurant_pizza_bp
 
 app = Flask(__name__)
 app.config.from_object(Config)
+# Route jsonify and request.get_json through orjson
+app.json = OrjsonProvider(app)
 
 # Initialize extensions
 db.init_app(app)
@@ -1,6 +1,19 @@
 import os
 
 class Config:
-    SQLALCHEMY_DATABASE_URI = 'sqlite:///pizza.db'
+    SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL', 'sqlite:///pizza.db')
     SQLALCHEMY_TRACK_MODIFICATIONS = False
-    JSON_SORT_KEYS = False 
\ No newline at end of file
+    JSON_SORT_KEYS = False
+
+    # Check connections before use and recycle them before servers drop idle ones
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        'pool_pre_ping': True,
+        'pool_recycle': 1800
+    }
+    if SQLALCHEMY_DATABASE_URI.startswith(('postgresql://', 'postgresql+psycopg2://')):
+        # Sizing and batched executemany only apply to the psycopg2 QueuePool engine
+        SQLALCHEMY_ENGINE_OPTIONS.update({
+            'pool_size': 20,
+            'max_overflow': 10,
+            'executemany_mode': 'values_plus_batch'
+        })
\ No newline at end of file
@@ -1,9 +1,13 @@
-from flask import Blueprint, jsonify
+from datetime import datetime
+from flask import Blueprint
 from server.models.pizza import Pizza
+from server.responses import make_json_response
 
 pizza_bp = Blueprint('pizzas', __name__)
 
 @pizza_bp.route('/pizzas', methods=['GET'])
 def get_pizzas():
-    pizzas = Pizza.query.all()
-    return jsonify([pizza.to_dict() for pizza in pizzas]) 
\ No newline at end of file
+    # Stream rows in batches so only a batch of Pizza instances is alive at a time
+    pizzas = Pizza.query.yield_per(500)
+    now = datetime.utcnow()
+    return make_json_response([pizza.to_dict(now) for pizza in pizzas]) 
\ No newline at end of file
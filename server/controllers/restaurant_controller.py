@@ -1,5 +1,6 @@
 from flask import Blueprint, jsonify, request
 from server.models.restaurant import Restaurant, db
+from server.responses import make_json_response
 
 restaurant_bp = Blueprint('restaurants', __name__)
 
@@ -13,7 +14,7 @@ def get_restaurant(id):
     restaurant = Restaurant.query.get(id)
     if not restaurant:
         return jsonify({"error": "Restaurant not found"}), 404
-    return jsonify(restaurant.to_dict_with_pizzas())
+    return make_json_response(restaurant.to_dict_with_pizzas())
 
 @restaurant_bp.route('/restaurants/<int:id>', methods=['DELETE'])
 def delete_restaurant(id):
@@ -1,22 +1,74 @@
+import orjson
 from flask import Blueprint, jsonify, request
+from sqlalchemy import exists
+from server.models.pizza import Pizza
+from server.models.restaurant import Restaurant
 from server.models.restaurant_pizza import RestaurantPizza, db
+from server.responses import make_json_response
 
 restaurant_pizza_bp = Blueprint('restaurant_pizzas', __name__)
 
+# Largest id a 64-bit integer column can hold
+MAX_ID = 2 ** 63 - 1
+
+def _validate_restaurant_pizza(data):
+    """
+    Check the shape of a restaurant_pizza payload before touching the database.
+    Returns:
+        tuple: (ok, error) where error is the message to report when ok is False.
+    """
+    if not isinstance(data, dict):
+        return False, "Invalid data"
+
+    price = data.get('price')
+    pizza_id = data.get('pizza_id')
+    restaurant_id = data.get('restaurant_id')
+
+    if isinstance(price, bool) or not isinstance(price, (int, float)):
+        return False, "Invalid data"
+    if not 1 <= price <= 30:
+        return False, "Price must be between 1 and 30"
+    for value in (pizza_id, restaurant_id):
+        if isinstance(value, bool) or not isinstance(value, int) or not 1 <= value <= MAX_ID:
+            return False, "Invalid data"
+    return True, None
+
 @restaurant_pizza_bp.route('/restaurant_pizzas', methods=['POST'])
 def create_restaurant_pizza():
-    data = request.get_json()
-    
+    # Keep request.get_json()'s contract: only application/json bodies are accepted
+    if not request.is_json:
+        return jsonify({"errors": ["Content-Type must be application/json"]}), 415
     try:
-        restaurant_pizza = RestaurantPizza(
-            price=data['price'],
-            pizza_id=data['pizza_id'],
-            restaurant_id=data['restaurant_id']
-        )
+        data = orjson.loads(request.get_data(cache=False))
+    except orjson.JSONDecodeError:
+        return jsonify({"errors": ["Invalid data"]}), 400
+
+    ok, error = _validate_restaurant_pizza(data)
+    if not ok:
+        return jsonify({"errors": [error]}), 400
+
+    values = {
+        'price': data['price'],
+        'pizza_id': data['pizza_id'],
+        'restaurant_id': data['restaurant_id']
+    }
+
+    try:
+        # Check both rows in a single round trip
+        restaurant_exists, pizza_exists = db.session.query(
+            exists().where(Restaurant.id == values['restaurant_id']),
+            exists().where(Pizza.id == values['pizza_id'])
+        ).one()
+        if not (restaurant_exists and pizza_exists):
+            return jsonify({"errors": ["Invalid data"]}), 400
+
+        restaurant_pizza = RestaurantPizza(**values)
         db.session.add(restaurant_pizza)
+        db.session.flush()
+        # Serialize before commit so the expired instance isn't reloaded
+        body = restaurant_pizza.to_dict()
         db.session.commit()
-        return jsonify(restaurant_pizza.to_dict()), 201
-    except ValueError as e:
-        return jsonify({"errors": [str(e)]}), 400
+        return make_json_response(body, 201)
     except Exception as e:
-        return jsonify({"errors": ["Invalid data"]}), 400 
\ No newline at end of file
+        db.session.rollback()
+        return jsonify({"errors": ["Invalid data"]}), 400
\ No newline at end of file
@@ -0,0 +1,55 @@
+"""
+orjson-backed JSON provider for the Pizza Restaurant API
+"""
+from decimal import Decimal
+
+import orjson
+from flask.json.provider import DefaultJSONProvider
+
+# Naive datetimes from the database are UTC; render them with a trailing 'Z'
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z
+
+
+def orjson_default(obj):
+    """
+    Serialize types orjson does not handle natively.
+    Args:
+        obj: The object orjson could not serialize.
+    Returns:
+        A JSON-serializable representation of obj.
+    Raises:
+        TypeError: If obj has no known representation.
+    """
+    if isinstance(obj, Decimal):
+        return float(obj)
+    # SQLAlchemy models expose their API representation through to_dict()
+    to_dict = getattr(obj, 'to_dict', None)
+    if callable(to_dict):
+        return to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider that serializes and parses JSON with orjson.
+    """
+
+    def dumps(self, obj, **kwargs):
+        """
+        Serialize obj to a JSON string with orjson.
+        Args:
+            obj: The object to serialize.
+        Returns:
+            str: The JSON document.
+        """
+        return orjson.dumps(obj, default=orjson_default, option=ORJSON_OPTIONS).decode()
+
+    def loads(self, s, **kwargs):
+        """
+        Deserialize JSON from str or bytes with orjson.
+        Args:
+            s (str or bytes): The JSON document to parse.
+        Returns:
+            The parsed Python object.
+        """
+        return orjson.loads(s)
@@ -2,12 +2,54 @@
 This module defines the Pizza model for the Pizza Restaurant API.
 It includes fields for pizza details, nutritional info, customization, popularity, and special offers.
 """
+import re
 from flask_sqlalchemy import SQLAlchemy
-import json
+from sqlalchemy import false, text, true, update
+from sqlalchemy.orm import validates
+from sqlalchemy.types import String, TypeDecorator
 from datetime import datetime
 
+import orjson
+
+_json_loads = orjson.loads
+
+def _json_dumps(obj):
+    # orjson returns bytes; the column stores text
+    return orjson.dumps(obj).decode()
+
 db = SQLAlchemy()
 
+# Splits a comma-separated allergen string and strips whitespace around each name
+_ALLERGEN_SPLIT = re.compile(r'\s*,\s*')
+
+def _split_allergens(value):
+    """
+    Parse a comma-separated allergen string into a list, or None if it is blank.
+    """
+    value = value.strip()
+    return _ALLERGEN_SPLIT.split(value) if value else None
+
+class AllergenList(TypeDecorator):
+    """
+    Stores a list of allergen names as a JSON array in a string column.
+    Rows written before the switch to JSON hold comma-separated strings; those are split on read.
+    """
+    impl = String
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        # Writes that bypass the model validator (bulk inserts, Core statements) may pass a string
+        if isinstance(value, str):
+            value = _split_allergens(value)
+        return _json_dumps(list(value)) if value else None
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        if value.startswith('['):
+            return _json_loads(value)
+        return _split_allergens(value)
+
 class Pizza(db.Model):
     """
     SQLAlchemy model for pizzas in the Pizza Restaurant API.
@@ -34,13 +76,14 @@ class Pizza(db.Model):
     price = db.Column(db.Float, nullable=False)
     description = db.Column(db.Text)
     image_url = db.Column(db.String)
-    category = db.Column(db.String, nullable=False, default='classic')
-    size = db.Column(db.String, nullable=False, default='medium')
-    is_available = db.Column(db.Boolean, default=True)
-    rating = db.Column(db.Float, default=0.0)
-    rating_count = db.Column(db.Integer, default=0)
+    # Python-side defaults stay until a migration adds the server defaults to existing tables
+    category = db.Column(db.String, nullable=False, default='classic', server_default='classic')
+    size = db.Column(db.String, nullable=False, default='medium', server_default='medium')
+    is_available = db.Column(db.Boolean, default=True, server_default=true())
+    rating = db.Column(db.Float, default=0.0, server_default=text('0'))
+    rating_count = db.Column(db.Integer, default=0, server_default=text('0'))
     prep_time = db.Column(db.Integer)  # in minutes
-    allergens = db.Column(db.String)  # comma-separated list of allergens
+    allergens = db.Column(AllergenList)  # list of allergen names, stored as a JSON array
     
     # Nutritional information
     calories = db.Column(db.Integer)
@@ -51,14 +94,16 @@ class Pizza(db.Model):
     
     # JSON string of available customizations for the pizza
     customization_options = db.Column(db.Text)  # JSON string of available customizations
+    # (raw JSON string, parsed dict) of the last decoded customization_options
+    _customization_cache = None
     
     # Tracks the number of times this pizza has been ordered
-    order_count = db.Column(db.Integer, default=0)
+    order_count = db.Column(db.Integer, default=0, server_default=text('0'))
     # Timestamp of the last time this pizza was ordered
     last_ordered_at = db.Column(db.DateTime)
     
     # Special offers
-    is_special = db.Column(db.Boolean, default=False)
+    is_special = db.Column(db.Boolean, default=False, server_default=false())
     special_price = db.Column(db.Float)
     special_start_date = db.Column(db.DateTime)
     special_end_date = db.Column(db.DateTime)
@@ -84,7 +129,8 @@ class Pizza(db.Model):
         """
         Toggle the availability status of the pizza (available/unavailable).
         """
-        self.is_available = not self.is_available
+        # None means the server default (available) has not been applied yet
+        self.is_available = self.is_available is False
 
     def update_rating(self, new_rating):
         """
@@ -97,27 +143,77 @@ class Pizza(db.Model):
         if new_rating < 0 or new_rating > 5:
             raise ValueError("Rating must be between 0 and 5")
         
-        total_rating = (self.rating * self.rating_count) + new_rating
-        self.rating_count += 1
+        rating_count = self.rating_count or 0
+        total_rating = ((self.rating or 0.0) * rating_count) + new_rating
+        self.rating_count = rating_count + 1
         self.rating = total_rating / self.rating_count
 
+    @classmethod
+    def apply_rating(cls, session, pizza_id, new_rating):
+        """
+        Add a rating to a pizza with a single atomic UPDATE, without loading the row.
+        Args:
+            session: The SQLAlchemy session to execute the update in (not committed here).
+            pizza_id (int): The id of the pizza being rated.
+            new_rating (float): The new rating to add (must be between 0 and 5).
+        Returns:
+            bool: True if the pizza exists and was updated, otherwise False.
+        Raises:
+            ValueError: If the new rating is not between 0 and 5.
+        """
+        if new_rating < 0 or new_rating > 5:
+            raise ValueError("Rating must be between 0 and 5")
+
+        # Both SET expressions see the pre-update values of rating and rating_count
+        result = session.execute(
+            update(cls)
+            .where(cls.id == pizza_id)
+            .values(
+                rating=((cls.rating * cls.rating_count) + new_rating) / (cls.rating_count + 1),
+                rating_count=cls.rating_count + 1
+            )
+        )
+        return result.rowcount == 1
+
+    @validates('allergens')
+    def validate_allergens(self, key, allergens):
+        """
+        Store allergens as a list, accepting a comma-separated string as well.
+        Args:
+            allergens (list or str): Allergen names, or a comma-separated string of them.
+        Returns:
+            list: The allergen names to store, or None if none were given.
+        """
+        if isinstance(allergens, str):
+            return _split_allergens(allergens)
+        return list(allergens) if allergens else None
+
     def get_allergens_list(self):
         """
         Return allergens as a list of strings.
         Returns:
             list: List of allergen names (str) for this pizza.
         """
-        return [a.strip() for a in self.allergens.split(',')] if self.allergens else []
+        return self.allergens or []
 
     def get_customization_options(self):
         """
         Return customization options as a dictionary.
+        The parsed dict is cached per instance and shared between calls (including the one
+        embedded in to_dict()), so callers must not modify it; use set_customization_options().
         Returns:
-            dict: Customization options for this pizza.
+            dict: Customization options for this pizza (read-only).
         """
-        if not self.customization_options:
+        raw = self.customization_options
+        if not raw:
             return {}
-        return json.loads(self.customization_options)
+        # Reuse the parsed value while the column still holds the same string
+        cache = self._customization_cache
+        if cache is not None and cache[0] is raw:
+            return cache[1]
+        options = _json_loads(raw)
+        self._customization_cache = (raw, options)
+        return options
 
     def set_customization_options(self, options):
         """
@@ -129,39 +225,53 @@ class Pizza(db.Model):
         """
         if not isinstance(options, dict):
             raise ValueError("Customization options must be a dictionary")
-        self.customization_options = json.dumps(options)
+        self.customization_options = _json_dumps(options)
+        self._customization_cache = None
 
     def increment_order_count(self):
         """
         Increment the order count and update the last ordered timestamp for this pizza.
         """
-        self.order_count += 1
+        self.order_count = (self.order_count or 0) + 1
         self.last_ordered_at = datetime.utcnow()
 
-    def get_current_price(self):
+    def is_special_active(self, now=None):
+        """
+        Check whether the special offer applies at the given time.
+        Args:
+            now (datetime, optional): The time to check against; defaults to the current UTC time.
+        Returns:
+            bool: True if a special offer is active, otherwise False.
+        """
+        if not self.is_special or self.special_price is None:
+            return False
+        if now is None:
+            now = datetime.utcnow()
+        return (self.special_start_date is None or now >= self.special_start_date) and \
+               (self.special_end_date is None or now <= self.special_end_date)
+
+    def get_current_price(self, now=None):
         """
         Get the current price considering any active special offers.
+        Args:
+            now (datetime, optional): The time to price at; defaults to the current UTC time.
         Returns:
             float: The current price (special price if active, otherwise regular price).
         """
-        if self.is_special and self.special_price is not None:
-            now = datetime.utcnow()
-            if (self.special_start_date is None or now >= self.special_start_date) and \
-               (self.special_end_date is None or now <= self.special_end_date):
-                return self.special_price
+        if self.is_special_active(now):
+            return self.special_price
         return self.price
 
-    def get_discount_percentage(self):
+    def get_discount_percentage(self, now=None):
         """
         Calculate the discount percentage for active special offers.
+        Args:
+            now (datetime, optional): The time to check against; defaults to the current UTC time.
         Returns:
             float: The discount percentage if a special offer is active, otherwise 0.0.
         """
-        if self.is_special and self.special_price is not None:
-            now = datetime.utcnow()
-            if (self.special_start_date is None or now >= self.special_start_date) and \
-               (self.special_end_date is None or now <= self.special_end_date):
-                return round(((self.price - self.special_price) / self.price) * 100, 2)
+        if self.is_special_active(now):
+            return round(((self.price - self.special_price) / self.price) * 100, 2)
         return 0.0
 
     def set_special_offer(self, special_price, start_date=None, end_date=None):
@@ -190,14 +300,18 @@ class Pizza(db.Model):
         self.special_start_date = None
         self.special_end_date = None
 
-    # Convert the Pizza object to a dictionary for API responses
-    def to_dict(self):
+    # Convert the Pizza object to a dictionary for API responses (pass `now` to read the clock once per list)
+    def to_dict(self, now=None):
+        price = self.price
+        special_price = self.special_price
+        current_price = special_price if self.is_special_active(now) else price
+
         return {
             'id': self.id,
             'name': self.name,
             'ingredients': self.ingredients,
-            'price': self.get_current_price(),
-            'original_price': self.price,
+            'price': current_price,
+            'original_price': price,
             'description': self.description,
             'image_url': self.image_url,
             'category': self.category,
@@ -206,7 +320,7 @@ class Pizza(db.Model):
             'rating': self.rating,
             'rating_count': self.rating_count,
             'prep_time': self.prep_time,
-            'allergens': self.get_allergens_list(),
+            'allergens': self.allergens or [],
             'nutritional_info': {
                 'calories': self.calories,
                 'protein': self.protein,
@@ -217,12 +331,12 @@ class Pizza(db.Model):
             'customization_options': self.get_customization_options(),
             'popularity': {
                 'order_count': self.order_count,
-                'last_ordered_at': self.last_ordered_at.isoformat() if self.last_ordered_at else None
+                'last_ordered_at': self.last_ordered_at
             },
             'special_offer': {
                 'is_special': self.is_special,
-                'special_price': self.special_price,
-                'special_start_date': self.special_start_date.isoformat() if self.special_start_date else None,
-                'special_end_date': self.special_end_date.isoformat() if self.special_end_date else None
+                'special_price': special_price,
+                'special_start_date': self.special_start_date,
+                'special_end_date': self.special_end_date
             }
-        } 
\ No newline at end of file
+        }
\ No newline at end of file
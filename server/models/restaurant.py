@@ -1,5 +1,9 @@
+from datetime import datetime
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import select
 from sqlalchemy.orm import validates
+from server.models.pizza import Pizza
+from server.models.restaurant_pizza import RestaurantPizza
 
 db = SQLAlchemy()
 
@@ -21,9 +25,29 @@ class Restaurant(db.Model):
         }
 
     def to_dict_with_pizzas(self):
-        return {
-            'id': self.id,
-            'name': self.name,
-            'address': self.address,
-            'pizzas': [rp.pizza.to_dict() for rp in self.restaurant_pizzas]
-        } 
\ No newline at end of file
+        return Restaurant.bulk_to_dict_with_pizzas([self])[0]
+
+    @classmethod
+    def bulk_to_dict_with_pizzas(cls, restaurants):
+        # Load the pizzas for all restaurants in one query instead of walking relationships per row
+        pizzas_by_restaurant = {restaurant.id: [] for restaurant in restaurants}
+        if pizzas_by_restaurant:
+            rows = db.session.execute(
+                select(RestaurantPizza.restaurant_id, Pizza)
+                .join(RestaurantPizza.pizza)
+                .where(RestaurantPizza.restaurant_id.in_(list(pizzas_by_restaurant)))
+                .order_by(RestaurantPizza.id)
+            )
+            now = datetime.utcnow()
+            for restaurant_id, pizza in rows:
+                pizzas_by_restaurant[restaurant_id].append(pizza.to_dict(now))
+
+        return [
+            {
+                'id': restaurant.id,
+                'name': restaurant.name,
+                'address': restaurant.address,
+                'pizzas': pizzas_by_restaurant[restaurant.id]
+            }
+            for restaurant in restaurants
+        ] 
\ No newline at end of file
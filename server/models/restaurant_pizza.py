@@ -8,8 +8,8 @@ class RestaurantPizza(db.Model):
 
     id = db.Column(db.Integer, primary_key=True)
     price = db.Column(db.Integer, nullable=False)
-    restaurant_id = db.Column(db.Integer, db.ForeignKey('restaurants.id'), nullable=False)
-    pizza_id = db.Column(db.Integer, db.ForeignKey('pizzas.id'), nullable=False)
+    restaurant_id = db.Column(db.Integer, db.ForeignKey('restaurants.id'), nullable=False, index=True)
+    pizza_id = db.Column(db.Integer, db.ForeignKey('pizzas.id'), nullable=False, index=True)
 
     # Relationships
     restaurant = db.relationship('Restaurant', back_populates='restaurant_pizzas')
@@ -0,0 +1,25 @@
+"""
+JSON response helpers for the Pizza Restaurant API
+"""
+import orjson
+from flask import Response
+from server.json_provider import ORJSON_OPTIONS, orjson_default
+
+
+class JSONResponse(Response):
+    """
+    Response class for JSON bodies already serialized to bytes.
+    """
+    default_mimetype = 'application/json'
+
+
+def make_json_response(data, status=200):
+    """
+    Serialize data with orjson and wrap it in a JSON response.
+    Args:
+        data: The JSON-serializable payload (datetimes are serialized natively).
+        status (int): The HTTP status code of the response.
+    Returns:
+        JSONResponse: The response carrying the serialized payload.
+    """
+    return JSONResponse(orjson.dumps(data, default=orjson_default, option=ORJSON_OPTIONS), status=status)
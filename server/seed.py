@@ -11,33 +11,33 @@ def seed_database():
         Pizza.query.delete()
 
         # Create restaurants
-        restaurants = [
-            Restaurant(name="Pizza Palace", address="123 Main St"),
-            Restaurant(name="Slice of Heaven", address="456 Oak Ave"),
-            Restaurant(name="Pizza Paradise", address="789 Pine Rd")
+        restaurant_dicts = [
+            {"name": "Pizza Palace", "address": "123 Main St"},
+            {"name": "Slice of Heaven", "address": "456 Oak Ave"},
+            {"name": "Pizza Paradise", "address": "789 Pine Rd"}
         ]
-        db.session.add_all(restaurants)
-        db.session.commit()
+        db.session.bulk_insert_mappings(Restaurant, restaurant_dicts)
 
         # Create pizzas
-        pizzas = [
-            Pizza(name="Margherita", ingredients="Dough, Tomato Sauce, Mozzarella, Basil"),
-            Pizza(name="Pepperoni", ingredients="Dough, Tomato Sauce, Mozzarella, Pepperoni"),
-            Pizza(name="Vegetarian", ingredients="Dough, Tomato Sauce, Mozzarella, Bell Peppers, Mushrooms, Onions")
+        pizza_dicts = [
+            {"name": "Margherita", "ingredients": "Dough, Tomato Sauce, Mozzarella, Basil"},
+            {"name": "Pepperoni", "ingredients": "Dough, Tomato Sauce, Mozzarella, Pepperoni"},
+            {"name": "Vegetarian", "ingredients": "Dough, Tomato Sauce, Mozzarella, Bell Peppers, Mushrooms, Onions"}
         ]
-        db.session.add_all(pizzas)
-        db.session.commit()
+        db.session.bulk_insert_mappings(Pizza, pizza_dicts)
 
         # Create restaurant_pizzas
-        restaurant_pizzas = [
-            RestaurantPizza(price=10, restaurant_id=1, pizza_id=1),
-            RestaurantPizza(price=12, restaurant_id=1, pizza_id=2),
-            RestaurantPizza(price=11, restaurant_id=2, pizza_id=1),
-            RestaurantPizza(price=13, restaurant_id=2, pizza_id=3),
-            RestaurantPizza(price=12, restaurant_id=3, pizza_id=2),
-            RestaurantPizza(price=14, restaurant_id=3, pizza_id=3)
+        rp_dicts = [
+            {"price": 10, "restaurant_id": 1, "pizza_id": 1},
+            {"price": 12, "restaurant_id": 1, "pizza_id": 2},
+            {"price": 11, "restaurant_id": 2, "pizza_id": 1},
+            {"price": 13, "restaurant_id": 2, "pizza_id": 3},
+            {"price": 12, "restaurant_id": 3, "pizza_id": 2},
+            {"price": 14, "restaurant_id": 3, "pizza_id": 3}
         ]
-        db.session.add_all(restaurant_pizzas)
+        db.session.bulk_insert_mappings(RestaurantPizza, rp_dicts)
+
+        # Write everything in a single transaction
         db.session.commit()
 
 if __name__ == '__main__':